@@ -4,10 +4,10 @@ rtc_gamma processing for HyP3
 import logging
 import sys
 from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from shutil import make_archive
 
-from hyp3lib.aws import upload_file_to_s3
 from hyp3lib.fetch import write_credentials_to_netrc_file
 from hyp3lib.image import create_thumbnail
 from hyp3lib.util import string_is_true
@@ -16,6 +16,7 @@ from pkg_resources import load_entry_point
 from hyp3_gamma import util
 from hyp3_gamma.insar.ifm_sentinel import insar_sentinel_gamma
 from hyp3_gamma.rtc.rtc_sentinel import rtc_sentinel_gamma
+from hyp3_gamma.util import upload_file_to_s3
 
 
 def main():
@@ -32,6 +33,12 @@ def main():
     )
 
 
+def _upload_browse_to_s3(browse, bucket, bucket_prefix):
+    thumbnail = create_thumbnail(browse)
+    upload_file_to_s3(browse, bucket, bucket_prefix)
+    upload_file_to_s3(thumbnail, bucket, bucket_prefix)
+
+
 def rtc():
     parser = ArgumentParser()
     parser.add_argument('--username', required=True)
@@ -78,10 +85,14 @@ def rtc():
         for browse in product_dir.glob('*.png'):
             create_thumbnail(browse, output_dir=product_dir)
 
-        upload_file_to_s3(Path(output_zip), args.bucket, args.bucket_prefix)
-
-        for product_file in product_dir.iterdir():
-            upload_file_to_s3(product_file, args.bucket, args.bucket_prefix)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(upload_file_to_s3, Path(output_zip), args.bucket, args.bucket_prefix)]
+            futures.extend(
+                executor.submit(upload_file_to_s3, product_file, args.bucket, args.bucket_prefix)
+                for product_file in product_dir.iterdir()
+            )
+            for future in futures:
+                future.result()
 
 
 def insar():
@@ -108,8 +119,11 @@ def insar():
     write_credentials_to_netrc_file(args.username, args.password)
 
     g1, g2 = util.earlier_granule_first(args.granules[0], args.granules[1])
-    reference_granule = util.get_granule(g1)
-    secondary_granule = util.get_granule(g2)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        reference_future = executor.submit(util.get_granule, g1)
+        secondary_future = executor.submit(util.get_granule, g2)
+        reference_granule = reference_future.result()
+        secondary_granule = secondary_future.result()
 
     rlooks, alooks = (20, 4) if args.looks == '20x4' else (10, 2)
 
@@ -127,12 +141,14 @@ def insar():
     output_zip = make_archive(base_name=product_name, format='zip', base_dir=product_name)
 
     if args.bucket:
-        upload_file_to_s3(Path(output_zip), args.bucket, args.bucket_prefix)
-        browse_images = Path(product_name).glob('*.png')
-        for browse in browse_images:
-            thumbnail = create_thumbnail(browse)
-            upload_file_to_s3(browse, args.bucket, args.bucket_prefix)
-            upload_file_to_s3(thumbnail, args.bucket, args.bucket_prefix)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(upload_file_to_s3, Path(output_zip), args.bucket, args.bucket_prefix)]
+            futures.extend(
+                executor.submit(_upload_browse_to_s3, browse, args.bucket, args.bucket_prefix)
+                for browse in Path(product_name).glob('*.png')
+            )
+            for future in futures:
+                future.result()
 
 
 if __name__ == '__main__':
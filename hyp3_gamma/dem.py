@@ -1,8 +1,9 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 from subprocess import PIPE, run
 from tempfile import TemporaryDirectory
-from typing import Generator, List
+from typing import Generator, List, Tuple
 
 from hyp3lib import DemError
 from osgeo import gdal, ogr
@@ -31,17 +32,22 @@ def get_dem_features() -> Generator[ogr.Feature, None, None]:
     del ds
 
 
+@lru_cache(maxsize=1)
+def get_dem_file_geometries() -> List[Tuple[str, ogr.Geometry]]:
+    return [(feature.GetField('file_path'), feature.GetGeometryRef().Clone()) for feature in get_dem_features()]
+
+
 def intersects_dem(geometry: ogr.Geometry) -> bool:
-    for feature in get_dem_features():
-        if feature.GetGeometryRef().Intersects(geometry):
+    for _, dem_geometry in get_dem_file_geometries():
+        if dem_geometry.Intersects(geometry):
             return True
 
 
 def get_dem_file_paths(geometry: ogr.Geometry) -> List[str]:
     file_paths = []
-    for feature in get_dem_features():
-        if feature.GetGeometryRef().Intersects(geometry):
-            file_paths.append(feature.GetField('file_path'))
+    for file_path, dem_geometry in get_dem_file_geometries():
+        if dem_geometry.Intersects(geometry):
+            file_paths.append(file_path)
     return file_paths
 
 
@@ -92,7 +98,8 @@ def prepare_dem_geotiff(output_name: str, geometry: ogr.Geometry, pixel_size: fl
         pixel_size: Pixel size for the output GeoTIFF in meters
 
     """
-    with GDALConfigManager(GDAL_DISABLE_READDIR_ON_OPEN='EMPTY_DIR'):
+    with GDALConfigManager(GDAL_DISABLE_READDIR_ON_OPEN='EMPTY_DIR', GDAL_NUM_THREADS='ALL_CPUS',
+                           CPL_VSIL_CURL_USE_HEAD='NO', VSI_CACHE='TRUE'):
         if not intersects_dem(geometry):
             raise DemError(f'Copernicus GLO-30 Public DEM does not intersect this geometry: {geometry}')
 
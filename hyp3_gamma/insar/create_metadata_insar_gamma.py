@@ -28,17 +28,22 @@ def create_readme_file(refFile, secFile, outfile, pixelSize):
 
     gamma_ver = gamma_version()
 
+    replacements = {
+        "[DATE]": date,
+        "[TIME]": "{}00".format(time),
+        "[REF_NAME]": refname,
+        "[SEC_NAME]": secname,
+        "[YEARPROCESSED]": "{}".format(year),
+        "[YEARACQUIRED]": refname[17:21],
+        "[LOOKS]": "{}".format(txtlooks),
+        "[SPACING]": "{}".format(pixelSize),
+        "[HYP3_VER]": "{}".format(__version__),
+        "[GAMMA_VER]": "{}".format(gamma_ver),
+    }
+
+    with open("{}/README_InSAR_GAMMA.txt".format(etcdir)) as f:
+        text = f.read()
+    for token, value in replacements.items():
+        text = text.replace(token, value)
     with open(outfile, "w") as g:
-        with open("{}/README_InSAR_GAMMA.txt".format(etcdir)) as f:
-            for line in f:
-                line = line.replace("[DATE]", date)
-                line = line.replace("[TIME]", "{}00".format(time))
-                line = line.replace("[REF_NAME]", refname)
-                line = line.replace("[SEC_NAME]", secname)
-                line = line.replace("[YEARPROCESSED]", "{}".format(year))
-                line = line.replace("[YEARACQUIRED]", refname[17:21])
-                line = line.replace("[LOOKS]", "{}".format(txtlooks))
-                line = line.replace("[SPACING]", "{}".format(pixelSize))
-                line = line.replace("[HYP3_VER]", "{}".format(__version__))
-                line = line.replace("[GAMMA_VER]", "{}".format(gamma_ver))
-                g.write("{}".format(line))
+        g.write(text)
@@ -4,9 +4,9 @@ import argparse
 import glob
 import logging
 import os
-import re
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from secrets import token_hex
 
@@ -26,23 +26,20 @@ from hyp3_gamma.insar.unwrapping_geocoding import unwrapping_geocoding
 
 log = logging.getLogger(__name__)
 
+SECONDS_IN_A_DAY = 60 * 60 * 24
 
-def get_bursts(mydir, name):
-    back = os.getcwd()
-    os.chdir(os.path.join(mydir, "annotation"))
 
+def get_bursts(annotation_dir, annotation_files, name):
     total_bursts = None
     time = []
-    for myfile in os.listdir("."):
+    for myfile in annotation_files:
         if name in myfile:
-            root = etree.parse(myfile)
+            root = etree.parse(os.path.join(annotation_dir, myfile))
             for coord in root.iter('azimuthAnxTime'):
                 time.append(float(coord.text))
             for count in root.iter('burstList'):
                 total_bursts = int(count.attrib['count'])
 
-    os.chdir(back)
-
     return time, total_bursts
 
 
@@ -51,12 +48,17 @@ def get_burst_overlaps(reference_dir, secondary_dir):
     burst_tab1 = "%s_burst_tab" % reference_dir[17:25]
     burst_tab2 = "%s_burst_tab" % secondary_dir[17:25]
 
+    reference_annotation_dir = os.path.join(reference_dir, "annotation")
+    secondary_annotation_dir = os.path.join(secondary_dir, "annotation")
+    reference_annotation_files = os.listdir(reference_annotation_dir)
+    secondary_annotation_files = os.listdir(secondary_annotation_dir)
+
     with open(burst_tab1, "w") as f1:
         with open(burst_tab2, "w") as f2:
             for name in ['001.xml', '002.xml', '003.xml']:
-                time1, total_bursts1 = get_bursts(reference_dir, name)
+                time1, total_bursts1 = get_bursts(reference_annotation_dir, reference_annotation_files, name)
                 log.info("total_bursts1, time1 {} {}".format(total_bursts1, time1))
-                time2, total_bursts2 = get_bursts(secondary_dir, name)
+                time2, total_bursts2 = get_bursts(secondary_annotation_dir, secondary_annotation_files, name)
                 log.info("total_bursts2, time2 {} {}".format(total_bursts2, time2))
                 cnt = 1
                 start1 = 0
@@ -113,9 +115,8 @@ def least_precise_orbit_of(orbits):
 
 
 def timedetla_in_days(delta):
-    seconds_in_a_day = 60 * 60 * 24
     total_seconds = abs(delta.total_seconds())
-    return round(total_seconds/seconds_in_a_day)
+    return round(total_seconds/SECONDS_IN_A_DAY)
 
 
 def get_product_name(reference_name, secondary_name, orbit_files, pixel_spacing=80, water_mask=False):
@@ -141,56 +142,58 @@ def get_product_name(reference_name, secondary_name, orbit_files, pixel_spacing=
 
 def move_output_files(output, reference, prod_dir, long_output, include_los_displacement, include_look_vectors,
                       include_wrapped_phase, include_inc_map, water_masking):
+    product_path = os.path.join(prod_dir, long_output)
+
     inName = "{}.mli.geo.tif".format(reference)
-    outName = "{}_amp.tif".format(os.path.join(prod_dir, long_output))
+    outName = "{}_amp.tif".format(product_path)
     shutil.copy(inName, outName)
 
     inName = "{}.cc.geo.tif".format(output)
-    outName = "{}_corr.tif".format(os.path.join(prod_dir, long_output))
+    outName = "{}_corr.tif".format(product_path)
     if os.path.isfile(inName):
         shutil.copy(inName, outName)
 
     inName = "{}.vert.disp.geo.org.tif".format(output)
-    outName = "{}_vert_disp.tif".format(os.path.join(prod_dir, long_output))
+    outName = "{}_vert_disp.tif".format(product_path)
     shutil.copy(inName, outName)
 
     inName = "{}.adf.unw.geo.tif".format(output)
-    outName = "{}_unw_phase.tif".format(os.path.join(prod_dir, long_output))
+    outName = "{}_unw_phase.tif".format(product_path)
     shutil.copy(inName, outName)
 
     if include_wrapped_phase:
         inName = "{}.diff0.man.adf.geo.tif".format(output)
-        outName = "{}_wrapped_phase.tif".format(os.path.join(prod_dir, long_output))
+        outName = "{}_wrapped_phase.tif".format(product_path)
         shutil.copy(inName, outName)
 
     if include_los_displacement:
         inName = "{}.los.disp.geo.org.tif".format(output)
-        outName = "{}_los_disp.tif".format(os.path.join(prod_dir, long_output))
+        outName = "{}_los_disp.tif".format(product_path)
         shutil.copy(inName, outName)
 
     if include_inc_map:
         inName = "{}.inc.tif".format(output)
-        outName = "{}_inc_map.tif".format(os.path.join(prod_dir, long_output))
+        outName = "{}_inc_map.tif".format(product_path)
         shutil.copy(inName, outName)
 
     if water_masking:
         inName = "final_mask.tif"
-        outName = "{}_water_mask.tif".format(os.path.join(prod_dir, long_output))
+        outName = "{}_water_mask.tif".format(product_path)
         shutil.copy(inName, outName)
 
     if include_look_vectors:
         inName = "{}.lv_theta.tif".format(output)
-        outName = "{}_lv_theta.tif".format(os.path.join(prod_dir, long_output))
+        outName = "{}_lv_theta.tif".format(product_path)
         shutil.copy(inName, outName)
         inName = "{}.lv_phi.tif".format(output)
-        outName = "{}_lv_phi.tif".format(os.path.join(prod_dir, long_output))
+        outName = "{}_lv_phi.tif".format(product_path)
         shutil.copy(inName, outName)
 
     makeAsfBrowse("{}.diff0.man.adf.bmp.geo.tif".format(output),
-                  "{}_color_phase".format(os.path.join(prod_dir, long_output)))
+                  "{}_color_phase".format(product_path))
 
     makeAsfBrowse("{}.adf.unw.geo.bmp.tif".format(output),
-                  "{}_unw_phase".format(os.path.join(prod_dir, long_output)))
+                  "{}_unw_phase".format(product_path))
 
 
 def make_parameter_file(mydir, parameter_file_name, alooks, rlooks, dem_source):
@@ -214,10 +217,7 @@ def make_parameter_file(mydir, parameter_file_name, alooks, rlooks, dem_source):
     with open("baseline.log") as f:
         for line in f:
             if "estimated baseline perpendicular component" in line:
-                # FIXME: RE is overly complicated here. this is two simple string splits
-                t = re.split(":", line)
-                s = re.split(r'\s+', t[1])
-                baseline = float(s[1])
+                baseline = float(line.split(":")[1].split()[0])
 
     back = os.getcwd()
     os.chdir(os.path.join(reference_file, "annotation"))
@@ -236,15 +236,7 @@ def make_parameter_file(mydir, parameter_file_name, alooks, rlooks, dem_source):
                 utctime = ((int(s[0]) * 60 + int(s[1])) * 60) + float(s[2])
     os.chdir(back)
 
-    heading = None
-    name = f'{reference_date[:8]}.mli.par'
-    with open(name, "r") as f:
-        for line in f:
-            if "heading" in line:
-                t = re.split(":", line)
-                # FIXME: RE is overly complicated here. this is two simple string splits
-                s = re.split(r'\s+', t[1])
-                heading = float(s[1])
+    heading = float(getParameter(parfile, 'heading').split()[0])
 
     reference_file = reference_file.replace(".SAFE", "")
     secondary_file = secondary_file.replace(".SAFE", "")
@@ -293,11 +285,13 @@ def insar_sentinel_gamma(reference_file, secondary_file, rlooks=20, alooks=4, in
 
     #  Ingest the data files into gamma format
     log.info("Starting par_S1_SLC")
-    orbit_files = []
-    for granule in (reference_file, secondary_file):
-        orbit_file, _ = downloadSentinelOrbitFile(granule)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(downloadSentinelOrbitFile, granule)
+                   for granule in (reference_file, secondary_file)]
+        orbit_files = [future.result()[0] for future in futures]
+
+    for granule, orbit_file in zip((reference_file, secondary_file), orbit_files):
         par_s1_slc_single(granule, pol, os.path.abspath(orbit_file))
-        orbit_files.append(orbit_file)
 
     #  Fetch the DEM file
     log.info("Getting a DEM file")
@@ -336,11 +330,11 @@ def insar_sentinel_gamma(reference_file, secondary_file, rlooks=20, alooks=4, in
     log.info("Starting interf_pwr_s1_lt_tops_proc.py 2")
     interf_pwr_s1_lt_tops_proc(reference, secondary, hgt, rlooks=rlooks, alooks=alooks, iterations=3, step=2)
 
-    g = open("offsetfit3.log")
     offset = 1.0
-    for line in g:
-        if "final azimuth offset poly. coeff.:" in line:
-            offset = line.split(":")[1]
+    with open("offsetfit3.log") as f:
+        for line in f:
+            if "final azimuth offset poly. coeff.:" in line:
+                offset = line.split(":")[1]
     if float(offset) > 0.02:
         log.error("ERROR: Found azimuth offset of {}!".format(offset))
         sys.exit(1)
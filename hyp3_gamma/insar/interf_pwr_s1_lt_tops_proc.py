@@ -13,17 +13,11 @@ log = logging.getLogger(__name__)
 
 
 def create_slc2r_tab(SLC2tab, SLC2Rtab):
-    if os.path.isfile(SLC2Rtab):
-        os.remove(SLC2Rtab)
-
-    with open(SLC2Rtab, "wb") as g:
-        with open(SLC2tab) as f:
-            content = f.readlines()
-            for item in content:
-                item = item.rstrip()
-                out = item.replace("slc", "rslc")
-                out = out.replace("tops", "rtops")
-                g.write("{}\n".format(out).encode())
+    with open(SLC2tab) as f:
+        content = f.read()
+
+    with open(SLC2Rtab, "w") as g:
+        g.write(content.replace("slc", "rslc").replace("tops", "rtops"))
 
 
 def coregister_data(cnt, SLC2tab, SLC2Rtab, spar, mpar, mmli, smli, ifgname,
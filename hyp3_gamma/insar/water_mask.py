@@ -10,7 +10,7 @@ from osgeo import gdal, ogr, osr
 from hyp3_gamma.dem import get_geometry_from_kml
 
 
-def reproject_shapefile(tif_file, inshape, outshape, safe_dir):
+def reproject_shapefile(projection, inshape, outshape, safe_dir):
 
     # Get source projection from the SAFE dir
     geometry = get_geometry_from_kml(f'{safe_dir}/preview/map-overlay.kml')
@@ -19,9 +19,8 @@ def reproject_shapefile(tif_file, inshape, outshape, safe_dir):
     layer = dataSource.GetLayer()
     sourceprj = layer.GetSpatialRef()
 
-    # get target projection from tif_file
-    tif = gdal.Open(tif_file)
-    targetprj = osr.SpatialReference(wkt=tif.GetProjection())
+    # get target projection from the input raster
+    targetprj = osr.SpatialReference(wkt=projection)
 
     # set up the transform and create empty layer
     transform = osr.CoordinateTransformation(sourceprj, targetprj)
@@ -52,7 +51,7 @@ def reproject_shapefile(tif_file, inshape, outshape, safe_dir):
     return
 
 
-def get_water_mask(in_tif, upper_left, lower_right, res, safe_dir, mask_value=1):
+def get_water_mask(projection, upper_left, lower_right, res, safe_dir, mask_value=1):
     mask_location = '/vsicurl/https://asf-dem-west.s3.amazonaws.com/WATER_MASK'
 
     xmin, ymax = upper_left
@@ -60,7 +59,7 @@ def get_water_mask(in_tif, upper_left, lower_right, res, safe_dir, mask_value=1)
 
     shape_file = f'{mask_location}/GSHHG/GSHHS_f_L1.shp'
     reproj_shape_file = 'reproj_shape_file.shp'
-    reproject_shapefile(in_tif, shape_file, reproj_shape_file, safe_dir)
+    reproject_shapefile(projection, shape_file, reproj_shape_file, safe_dir)
 
     src_ds = ogr.Open(reproj_shape_file)
     src_lyr = src_ds.GetLayer()
@@ -94,18 +93,17 @@ def apply_water_mask(tiffile, outfile, safe_dir, maskval=0, band=1):
     """
 
     logging.info(f"Using mask value of {maskval}")
-    tif_info = gdal.Info(tiffile, format='json')
-    upper_left = tif_info['cornerCoordinates']['upperLeft']
-    lower_right = tif_info['cornerCoordinates']['lowerRight']
-
     src_ds = gdal.Open(tiffile)
     data = src_ds.GetRasterBand(band).ReadAsArray()
     proj = src_ds.GetProjection()
     trans = src_ds.GetGeoTransform()
     del src_ds
 
+    upper_left = (trans[0], trans[3])
+    lower_right = (trans[0] + trans[1] * data.shape[1], trans[3] + trans[5] * data.shape[0])
+
     logging.info("Applying water body mask")
-    mask = get_water_mask(tiffile, upper_left, lower_right, trans[1], safe_dir)
+    mask = get_water_mask(proj, upper_left, lower_right, trans[1], safe_dir)
     saa.write_gdal_file_byte("final_mask.tif", trans, proj, mask)
     data[mask == 0] = maskval
     saa.write_gdal_file("final_dem.tif", trans, proj, data)
@@ -14,7 +14,7 @@ class CoregistrationError(Exception):
 
 def get_std_dev(mk_geo_radcal2_log):
     with open(mk_geo_radcal2_log) as f:
-        line = [line for line in f.readlines() if line.startswith('final model fit std. dev. (samples)')][0]
+        line = next(line for line in f if line.startswith('final model fit std. dev. (samples)'))
     range_std_dev = float(line.split(':')[1].split()[0].strip())
     azimuth_std_dev = float(line.split(':')[2].strip())
     std_dev = sqrt(range_std_dev ** 2 + azimuth_std_dev ** 2)
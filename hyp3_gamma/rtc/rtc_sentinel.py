@@ -5,7 +5,9 @@ import os
 import shutil
 import zipfile
 from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from fnmatch import fnmatch
 from glob import glob
 from math import isclose
 from pathlib import Path
@@ -237,20 +239,24 @@ def create_area_geotiff(data_in, lookup_table, mli_par, dem_par, output_name):
         run(f'data2geotiff {dem_par} {temp_file.name} 2 {output_name}')
 
 
-def create_browse_images(out_dir, out_name, pol):
-    pol_amp_tif = f'{pol}-amp.tif'
-    outfile = f'{out_dir}/{out_name}'
+def _create_browse_image(tif, outfile):
     with NamedTemporaryFile() as rescaled_tif:
-        byteSigmaScale(pol_amp_tif, rescaled_tif.name)
+        byteSigmaScale(tif, rescaled_tif.name)
         makeAsfBrowse(rescaled_tif.name, outfile)
 
-    for file_type in ['inc_map', 'dem', 'area']:
-        tif = f'{out_dir}/{out_name}_{file_type}.tif'
-        if os.path.exists(tif):
-            outfile = f'{out_dir}/{out_name}_{file_type}'
-            with NamedTemporaryFile() as rescaled_tif:
-                byteSigmaScale(tif, rescaled_tif.name)
-                makeAsfBrowse(rescaled_tif.name, outfile)
+
+def create_browse_images(out_dir, out_name, pol):
+    pol_amp_tif = f'{pol}-amp.tif'
+    _create_browse_image(pol_amp_tif, f'{out_dir}/{out_name}')
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = []
+        for file_type in ['inc_map', 'dem', 'area']:
+            tif = f'{out_dir}/{out_name}_{file_type}.tif'
+            if os.path.exists(tif):
+                futures.append(executor.submit(_create_browse_image, tif, f'{out_dir}/{out_name}_{file_type}'))
+        for future in futures:
+            future.result()
 
     pol_tif = f'{out_dir}/{out_name}_{pol.upper()}.tif'
     shapefile = f'{out_dir}/{out_name}_shape.shp'
@@ -403,9 +409,10 @@ def rtc_sentinel_gamma(safe_dir: str, resolution: float = 30.0, radiometry: str
         processor_name='GAMMA',
         processor_version=gamma_version(),
     )
-    for pattern in ['*inc_map*png*', '*inc_map*kmz', '*dem*png*', '*dem*kmz', '*area*png*', '*area*kmz']:
-        for f in glob(f'{product_name}/{pattern}'):
-            os.remove(f)
+    cleanup_patterns = ['*inc_map*png*', '*inc_map*kmz', '*dem*png*', '*dem*kmz', '*area*png*', '*area*kmz']
+    for entry in os.scandir(product_name):
+        if any(fnmatch(entry.name, pattern) for pattern in cleanup_patterns):
+            os.remove(entry.path)
 
     append_additional_log_files(log_file, 'mk_geo_radcal_*.log')
     return product_name
@@ -1,7 +1,11 @@
 import logging
 import os
+from mimetypes import guess_type
+from pathlib import Path
 from zipfile import ZipFile
 
+import boto3
+from boto3.s3.transfer import TransferConfig
 from hyp3lib.fetch import download_file
 from hyp3lib.scene import get_download_url
 from osgeo import gdal
@@ -9,6 +13,13 @@ from osgeo import gdal
 log = logging.getLogger(__name__)
 gdal.UseExceptions()
 
+S3_CLIENT = boto3.client('s3')
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=64 * 1024 * 1024,
+    multipart_chunksize=64 * 1024 * 1024,
+    max_concurrency=8,
+)
+
 
 class GDALConfigManager:
     """Context manager for setting GDAL config options temporarily"""
@@ -32,9 +43,24 @@ class GDALConfigManager:
             gdal.SetConfigOption(key, value)
 
 
+def get_content_type(file_location):
+    content_type = guess_type(file_location)[0]
+    if not content_type:
+        content_type = 'application/octet-stream'
+    return content_type
+
+
+def upload_file_to_s3(path_to_file: Path, bucket, prefix=''):
+    key = str(Path(prefix) / path_to_file.name)
+    extra_args = {'ContentType': get_content_type(key)}
+
+    log.info(f'Uploading s3://{bucket}/{key}')
+    S3_CLIENT.upload_file(str(path_to_file), bucket, key, extra_args, Config=TRANSFER_CONFIG)
+
+
 def get_granule(granule):
     download_url = get_download_url(granule)
-    zip_file = download_file(download_url, chunk_size=10485760)
+    zip_file = download_file(download_url, chunk_size=16 * 1024 * 1024)
     safe_dir = unzip_granule(zip_file, remove=True)
     return safe_dir
 
@@ -49,10 +75,12 @@ def unzip_granule(zip_file, remove=False):
     return safe_dir.strip('/')
 
 
+def granule_sort_key(granule):
+    return int(granule[17:32].replace('T', ''))
+
+
 def earlier_granule_first(g1, g2):
-    if g1[17:32] <= g2[17:32]:
-        return g1, g2
-    return g2, g1
+    return tuple(sorted((g1, g2), key=granule_sort_key))
 
 
 def set_pixel_as_point(tif_file, shift_origin=False):
@@ -30,6 +30,7 @@ setup(
     python_requires='~=3.6',
 
     install_requires=[
+        'boto3',
         'gdal',
         'hyp3lib>=1.6.7,<2',
         'hyp3_metadata>=0.4.2,<1',
@@ -31,6 +31,15 @@ def test_gdal_config_manager():
     assert gdal.GetConfigOption('OPTION4') == 'VALUE4'
 
 
+def test_granule_sort_key():
+    a = 'S1A_EW_GRDM_1SSH_20141112T235735_20141112T235835_003255_003C39_913F'
+    b = 'S1A_IW_SLC__1SDV_20200701T170703_20200701T170730_033264_03DA9B_CAB2'
+
+    assert util.granule_sort_key(a) == 20141112235735
+    assert util.granule_sort_key(b) == 20200701170703
+    assert sorted([b, a], key=util.granule_sort_key) == [a, b]
+
+
 def test_earlier_granule_first():
     a = 'S1A_EW_GRDM_1SSH_20141112T235735_20141112T235835_003255_003C39_913F'
     b = 'S1A_EW_GRDM_1SSH_20141112T235835_20141112T235935_003255_003C39_D8E7'